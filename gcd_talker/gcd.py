@@ -18,12 +18,21 @@ Grand Comics Database™ (https://www.comics.org) information source
 from __future__ import annotations
 
 import argparse
+import atexit
+import collections
+import concurrent.futures
+import functools
+import itertools
 import json
 import logging
+import operator
 import pathlib
 import re
 import sqlite3
-from typing import Any, Callable, TypedDict
+import threading
+import time
+import weakref
+from typing import Any, Callable, Iterator, TypedDict, cast
 from urllib.parse import urljoin
 
 import requests
@@ -37,8 +46,24 @@ from comictalker.comiccacher import Issue as CCIssue
 from comictalker.comiccacher import Series as CCSeries
 from comictalker.comictalker import ComicTalker, TalkerDataError, TalkerNetworkError
 from pyrate_limiter import Limiter, RequestRate
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import LocationParseError
-from urllib3.util import parse_url
+from urllib3.util import Retry, parse_url
+
+try:
+    import lxml.etree
+    import lxml.html
+
+    has_lxml = True
+except ImportError:
+    has_lxml = False
+
+try:
+    import orjson
+
+    has_orjson = True
+except ImportError:
+    has_orjson = False
 
 logger = logging.getLogger(f"comictalker.{__name__}")
 
@@ -63,6 +88,7 @@ class GCDIssue(TypedDict, total=False):
     number: str
     issue_title: str
     series_id: int
+    variant_of_id: int | None
     issue_notes: str
     volume: int
     imprint: str
@@ -78,6 +104,7 @@ class GCDIssue(TypedDict, total=False):
     story_titles: list[str]  # combined gcd_story title_inferred and type_id for display title
     genres: list[str]  # gcd_story semicolon separated
     synopses: list[str]  # combined gcd_story synopsis
+    story_descriptions: list[str]  # gcd_story synopsis prefixed with its own title
     image: str
     alt_image_urls: list[str]  # generated via variant_of_id
     credits: list[
@@ -88,12 +115,222 @@ class GCDIssue(TypedDict, total=False):
 
 limiter = Limiter(RequestRate(10, 10))
 
+# Row columns copied as-is into a GCDIssue, the "complete" ones are only selected when fetching a single issue
+_ISSUE_COLUMNS = ("id", "key_date", "number", "issue_title", "series_id", "variant_of_id")
+_ISSUE_COMPLETE_COLUMNS = (
+    "issue_notes",
+    "volume",
+    "price",
+    "isbn",
+    "imprint",
+    "maturity_rating",
+    "country",
+    "country_iso",
+    "language",
+    "language_iso",
+)
+
+# Row columns holding concatenated values and the separator to split them into a list with
+_ISSUE_COMPLETE_SPLIT_COLUMNS = (("characters", "; "),)
+
+# Number of cover pages fetched at once (still subject to the limiter)
+_COVER_WORKERS = 8
+
+# Scraped cover URLs are kept for a week, up to this many issues
+_COVER_CACHE_TTL = 7 * 24 * 60 * 60
+_COVER_CACHE_SIZE = 50000
+
+# Number of series kept in memory, see GCDTalker._remember_series
+_SERIES_MEMO_SIZE = 4096
+
+# Number of fully fetched issues kept in memory, see GCDTalker._remember_issue
+_ISSUE_MEMO_SIZE = 512
+
+# Number of fetched issues written to the cache DB together, see GCDTalker._queue_issue_cache
+_CACHE_WRITE_BATCH = 32
+
+# Most IDs bound to one IN clause, SQLite before 3.32 allows only 999 variables per statement
+_SQL_IN_BATCH = 500
+
 
 class GCDCredit(TypedDict):
     name: str
     gcd_role: str
 
 
+# SQL statements are module constants so the same string reaches the sqlite3 driver on every call and its prepared
+# statement cache is hit. Statements with "{}" take a comma separated list of "?" placeholders for an IN clause.
+# The story type filter must stay in the LEFT JOIN's ON clause (not the WHERE) so issues without any stories are still
+# returned by the same query.
+_SQL_SEARCH_SERIES_FIELDS: str = """SELECT gcd_series.id AS 'id', gcd_series.name AS 'series_name',
+                    gcd_series.sort_name AS 'sort_name', gcd_series.notes AS 'notes',
+                    gcd_series.year_began AS 'year_began', gcd_series.year_ended AS 'year_ended',
+                    gcd_series.issue_count AS 'issue_count', gcd_publisher.name AS 'publisher_name' """
+
+# Column positions in _SQL_SEARCH_SERIES_FIELDS, search results are read as plain tuples
+(
+    _SEARCH_COL_ID,
+    _SEARCH_COL_NAME,
+    _SEARCH_COL_SORT_NAME,
+    _SEARCH_COL_NOTES,
+    _SEARCH_COL_YEAR_BEGAN,
+    _SEARCH_COL_YEAR_ENDED,
+    _SEARCH_COL_ISSUE_COUNT,
+    _SEARCH_COL_PUBLISHER,
+) = range(8)
+
+# Start from gcd_series so a LIKE pattern without a leading wildcard is a range scan on idx_series_name_nocase. The
+# literal search stays case sensitive, the NOCASE comparison is only there so it can look up the same index
+_SQL_SEARCH_SERIES_LITERAL: str = f"""{_SQL_SEARCH_SERIES_FIELDS}FROM gcd_series
+                    LEFT JOIN gcd_publisher ON gcd_series.publisher_id=gcd_publisher.id
+                    WHERE gcd_series.name = ?1 COLLATE NOCASE AND gcd_series.name = ?1"""
+
+_SQL_SEARCH_SERIES_LIKE: str = f"""{_SQL_SEARCH_SERIES_FIELDS}FROM gcd_series
+                    LEFT JOIN gcd_publisher ON gcd_series.publisher_id=gcd_publisher.id
+                    WHERE gcd_series.name LIKE ?"""
+
+_SQL_SEARCH_SERIES_FTS: str = f"""{_SQL_SEARCH_SERIES_FIELDS}FROM fts
+                    LEFT JOIN gcd_series on fts.rowid=gcd_series.id
+                    LEFT JOIN gcd_publisher ON gcd_series.publisher_id=gcd_publisher.id
+                    WHERE fts MATCH ?;"""
+
+_SQL_FETCH_SERIES: str = """SELECT gcd_series.id AS 'id', gcd_series.name AS 'series_name',
+                    gcd_series.sort_name AS 'sort_name', gcd_series.notes AS 'notes',
+                    gcd_series.year_began AS 'year_began', gcd_series.year_ended AS 'year_ended',
+                    gcd_series.issue_count AS 'issue_count', gcd_publisher.name AS 'publisher_name',
+                    gcd_series.country_id AS 'country_id', gcd_series.language_id AS 'lang_id',
+                    gcd_series.publishing_format AS 'format', gcd_series.is_current AS 'is_current',
+                    gcd_series.first_issue_id AS 'first_issue_id'
+                    FROM gcd_series
+                    LEFT JOIN gcd_publisher ON gcd_series.publisher_id=gcd_publisher.id
+                    WHERE gcd_series.id IN ({})"""
+
+_SQL_ISSUES_IN_SERIES: str = """SELECT gcd_issue.id AS 'id', gcd_issue.number AS 'number',
+                    gcd_issue.key_date AS 'key_date', gcd_issue.title AS 'issue_title',
+                    gcd_issue.series_id AS 'series_id', gcd_issue.variant_of_id AS 'variant_of_id',
+                    gcd_story.title AS 'story_title'
+                    FROM gcd_issue
+                    LEFT JOIN gcd_story ON gcd_story.issue_id = gcd_issue.id AND gcd_story.type_id = 19
+                    WHERE gcd_issue.series_id = ? AND gcd_issue.variant_of_id IS NULL
+                    ORDER BY gcd_issue.id, gcd_story.sequence_number;"""
+
+_SQL_ISSUES_BY_NUMBER_FIELDS: str = """SELECT gcd_issue.id AS 'id', gcd_issue.key_date AS 'key_date',
+                    gcd_issue.number AS 'number', gcd_issue.title AS 'issue_title', gcd_issue.series_id AS 'series_id',
+                    gcd_issue.variant_of_id AS 'variant_of_id', gcd_story.title AS 'story_title'
+                    FROM gcd_issue
+                    LEFT JOIN gcd_story ON gcd_story.issue_id=gcd_issue.id AND gcd_story.type_id=19
+                    WHERE gcd_issue.series_id IN ({}) AND gcd_issue.variant_of_id IS NULL """
+
+_SQL_ISSUES_BY_NUMBER: str = f"""{_SQL_ISSUES_BY_NUMBER_FIELDS}AND gcd_issue.number=? AND
+                    (gcd_issue.key_date LIKE ? OR gcd_issue.key_date='')
+                    ORDER BY gcd_issue.id, gcd_story.sequence_number;"""
+
+_SQL_ISSUES_BY_NUMBER_NN: str = f"""{_SQL_ISSUES_BY_NUMBER_FIELDS}AND
+                    (gcd_issue.number=? OR gcd_issue.number='[nn]') AND
+                    (gcd_issue.key_date LIKE ? OR gcd_issue.key_date='')
+                    ORDER BY gcd_issue.id, gcd_story.sequence_number;"""
+
+# The imprint subquery is correlated to the outer issue so the same select works for any WHERE. The series columns
+# match _SQL_FETCH_SERIES so the issue's series can be built from the same row. The stories come back as a JSON array
+# so titles and synopses containing newlines or separators survive, see GCDTalker._format_gcd_stories
+# Aggregate FILTER needs SQLite 3.30, older versions leave the all NULL row of an issue without stories to Python
+_SQL_STORIES_FILTER: str = " FILTER (WHERE gcd_story.id IS NOT NULL)" if sqlite3.sqlite_version_info >= (3, 30) else ""
+
+_SQL_ISSUE_FIELDS: str = f"""SELECT gcd_issue.id AS 'id', gcd_issue.key_date AS 'key_date',
+                    gcd_issue.number AS 'number', gcd_issue.title AS 'issue_title', gcd_issue.series_id AS 'series_id',
+                    gcd_issue.variant_of_id AS 'variant_of_id', gcd_issue.price AS 'price',
+                    gcd_issue.valid_isbn AS 'isbn', gcd_issue.notes AS 'issue_notes', gcd_issue.volume AS 'volume',
+                    gcd_issue.rating AS 'maturity_rating', gcd_story.characters AS 'characters',
+                    stddata_country.name AS 'country', stddata_country.code AS 'country_iso',
+                    stddata_language.name AS 'language', stddata_language.code AS 'language_iso',
+                    gcd_series.name AS 'series_name', gcd_series.sort_name AS 'sort_name', gcd_series.notes AS 'notes',
+                    gcd_series.year_began AS 'year_began', gcd_series.year_ended AS 'year_ended',
+                    gcd_series.issue_count AS 'issue_count', gcd_publisher.name AS 'publisher_name',
+                    gcd_series.publishing_format AS 'format',
+                    json_group_array(json_object('id', gcd_story.id, 'sequence_number', gcd_story.sequence_number,
+                    'title', gcd_story.title, 'genre', gcd_story.genre, 'synopsis', gcd_story.synopsis))
+                    {_SQL_STORIES_FILTER} AS 'stories',
+                    (SELECT GROUP_CONCAT(gcd_brand_group.name, '; ')
+                    FROM gcd_brand
+                    JOIN gcd_brand_emblem_group ON gcd_brand.id=gcd_brand_emblem_group.brand_id
+                    JOIN gcd_brand_group ON gcd_brand_emblem_group.brandgroup_id=gcd_brand_group.id
+                    WHERE gcd_brand.id=gcd_issue.brand_id
+                    AND gcd_publisher.name IS NOT gcd_brand_group.name
+                    ) AS 'imprint'
+                    FROM gcd_issue
+                    LEFT JOIN gcd_story ON gcd_story.issue_id=gcd_issue.id AND gcd_story.type_id=19
+                    LEFT JOIN gcd_indicia_publisher ON gcd_issue.indicia_publisher_id=gcd_indicia_publisher.id
+                    LEFT JOIN gcd_series ON gcd_issue.series_id=gcd_series.id
+                    LEFT JOIN gcd_publisher ON gcd_series.publisher_id=gcd_publisher.id
+                    LEFT JOIN stddata_country ON gcd_indicia_publisher.country_id=stddata_country.id
+                    LEFT JOIN stddata_language ON gcd_series.language_id=stddata_language.id """
+
+_SQL_ISSUE: str = f"""{_SQL_ISSUE_FIELDS}WHERE gcd_issue.id=?
+                    GROUP BY gcd_issue.id"""
+
+_SQL_ISSUES_BY_ID: str = f"""{_SQL_ISSUE_FIELDS}WHERE gcd_issue.id IN ({{}})
+                    GROUP BY gcd_issue.id"""
+
+_SQL_ISSUE_BY_NUMBER: str = f"""{_SQL_ISSUE_FIELDS}WHERE gcd_issue.series_id=? AND gcd_issue.number=?
+                    AND gcd_issue.variant_of_id IS NULL
+                    GROUP BY gcd_issue.id
+                    ORDER BY gcd_issue.id"""
+
+_SQL_ISSUE_BY_NUMBER_NN: str = f"""{_SQL_ISSUE_FIELDS}WHERE gcd_issue.series_id=? AND gcd_issue.variant_of_id IS NULL
+                    AND (gcd_issue.number=? OR gcd_issue.number='[nn]')
+                    GROUP BY gcd_issue.id
+                    ORDER BY gcd_issue.id"""
+
+_SQL_ISSUE_CREDITS_BY_ISSUE: str = """SELECT gcd_creator_name_detail.name, gcd_issue_credit.credit_name
+                    FROM gcd_issue_credit
+                    INNER JOIN gcd_creator_name_detail ON gcd_issue_credit.creator_id=gcd_creator_name_detail.id
+                    WHERE gcd_issue_credit.issue_id=? """
+
+_SQL_ISSUE_CREDITS_BY_STORY: str = """UNION ALL
+                    SELECT gcd_creator_name_detail.name, gcd_credit_type.name
+                    FROM gcd_story_credit
+                    INNER JOIN gcd_credit_type ON gcd_credit_type.id=gcd_story_credit.credit_type_id
+                    INNER JOIN gcd_creator_name_detail ON gcd_creator_name_detail.id=gcd_story_credit.creator_id
+                    WHERE gcd_story_credit.story_id IN ({})"""
+
+
+def _batched(ids: list[int]) -> Iterator[list[int]]:
+    """Split the IDs into lists small enough for one IN clause, see _SQL_IN_BATCH"""
+    for start in range(0, len(ids), _SQL_IN_BATCH):
+        yield ids[start : start + _SQL_IN_BATCH]
+
+
+def _cache_dumps(data: GCDSeries | GCDIssue) -> bytes:
+    """Encode a series or issue for ComicCacher"""
+    if has_orjson:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+# Keyed by the stored bytes, so an updated cache entry is simply a new key. The decoded dicts are shared between
+# callers and must not be modified
+@functools.lru_cache(maxsize=1024)
+def _cache_loads(data: bytes) -> Any:
+    """Decode a series or issue stored by _cache_dumps"""
+    if has_orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Talkers that may have issues queued for the cache DB. Held weakly so registering doesn't keep them alive until exit
+_live_talkers: weakref.WeakSet[GCDTalker] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_talkers() -> None:
+    """Write the queued issues of every talker still alive to the cache DB"""
+    for talker in list(_live_talkers):
+        try:
+            talker.flush_cache()
+        except Exception:
+            logger.exception("Failed to write queued issues to the cache DB at exit")
+
+
 class GCDTalker(ComicTalker):
     name: str = "Grand Comics Database"
     id: str = "gcd"
@@ -122,10 +359,47 @@ class GCDTalker(ComicTalker):
         self.download_gui_covers: bool = False
         self.download_tag_covers: bool = False
 
-        self.has_issue_id_type_id_index: bool = False
+        self.has_indices: bool = False
         self.has_fts5: bool = False
         self.has_fts5_checked: bool = False
 
+        # Shared connection to the GCD DB, see _connect
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock = threading.RLock()
+
+        # ComicTagger's cache, see _cacher
+        self._cvc: ComicCacher | None = None
+
+        # Issue web links only differ by ID, so resolve the base URL once
+        self._issue_url_prefix: str = urljoin(self.website, "issue/")
+
+        # Pooled HTTP connections for scraping covers
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=_COVER_WORKERS,
+                pool_maxsize=_COVER_WORKERS,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            ),
+        )
+
+        # Scraped cover URLs by issue ID, see _find_issue_images
+        self.cover_cache_file: pathlib.Path = self.cache_folder / "gcd_covers.db"
+        self.has_cover_cache: bool = False
+
+        # In memory copy of recently fetched series, checked before the cache DB and the GCD DB
+        self._series_memo: collections.OrderedDict[int, GCDSeries] = collections.OrderedDict()
+        # Likewise for fully fetched issues
+        self._issue_memo: collections.OrderedDict[int, GCDIssue] = collections.OrderedDict()
+        # Searches and fetches may come from several threads, a lookup and its move_to_end must not race an eviction
+        self._memo_lock = threading.Lock()
+
+        # Fully fetched issues waiting to be written to the cache DB, see _queue_issue_cache
+        self._pending_issues: dict[int, GCDIssue] = {}
+        self._pending_lock = threading.Lock()
+        _live_talkers.add(self)
+
         self.nn_is_issue_one: bool = True
         self.replace_nn_with_one: bool = False
 
@@ -206,7 +480,8 @@ class GCDTalker(ComicTalker):
             display_name="SQLite GCD DB",
             type=pathlib.Path,
             default=pathlib.Path.home(),
-            help="The path and filename of the GCD SQLite file",
+            help="The path and filename of the GCD SQLite file. Indices are added to it on first use, "
+            "which takes a few minutes and a few hundred MB of disk space",
         )
 
     def parse_settings(self, settings: dict[str, Any]) -> dict[str, Any]:
@@ -226,7 +501,9 @@ class GCDTalker(ComicTalker):
         old_db_file = self.db_file
         self.db_file = settings["gcd_filepath"]
         if self.db_file != old_db_file:
-            self.has_issue_id_type_id_index = False
+            self.close()
+            self.invalidate()
+            self.has_indices = False
             self.has_fts5 = False
             self.has_fts5_checked = False
 
@@ -251,32 +528,142 @@ class GCDTalker(ComicTalker):
         else:
             return "DB path does not exist", False
 
+    def _connect(self) -> sqlite3.Connection:
+        """Return the shared connection to the GCD DB, opening it tuned for read-heavy access on first use
+
+        Callers must hold _conn_lock for as long as they use the connection. Leaving its context manager commits, which
+        would end another thread's index creation transaction, and close() could close it while in use
+        """
+        with self._conn_lock:
+            if self._conn is None:
+                # Searches and issue fetches may come from Qt worker threads. The IN queries are a different statement
+                # for each number of IDs, so keep more prepared statements than the default 128
+                con = sqlite3.connect(self.db_file, check_same_thread=False, cached_statements=256)
+                con.row_factory = sqlite3.Row
+                con.text_factory = str
+
+                # The DB is only written to when creating indices, so favour reading: memory map the file, use a 64MB
+                # page cache and keep temporary b-trees (GROUP BY etc.) in memory
+                con.execute("PRAGMA mmap_size=1073741824;")
+                con.execute("PRAGMA cache_size=-65536;")
+                con.execute("PRAGMA temp_store=MEMORY;")
+
+                self._conn = con
+
+            return self._conn
+
+    def _cacher(self) -> ComicCacher:
+        """Return the ComicCacher, creating it (and checking the cache version and tables) on first use"""
+        if self._cvc is None:
+            self._cvc = ComicCacher(self.cache_folder, self.version)
+
+        return self._cvc
+
+    def close(self) -> None:
+        """Close the shared connection to the GCD DB, it will be reopened when next needed"""
+        self.flush_cache()
+
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def flush_cache(self) -> None:
+        """Write any queued issues to the cache DB"""
+        with self._pending_lock:
+            issues = list(self._pending_issues.values())
+            self._pending_issues.clear()
+
+        if issues:
+            self._cacher().add_issues_info(
+                self.id,
+                [CCIssue(id=str(x["id"]), series_id=str(x["series_id"]), data=_cache_dumps(x)) for x in issues],
+                True,
+            )
+
+    def _queue_issue_cache(self, issue: GCDIssue) -> None:
+        """Queue a fully fetched issue for the cache DB, writing the queue in one go once it is full"""
+        with self._pending_lock:
+            self._pending_issues[issue["id"]] = issue
+            full = len(self._pending_issues) >= _CACHE_WRITE_BATCH
+
+        if full:
+            self.flush_cache()
+
+    def invalidate(self) -> None:
+        """Forget any series and issues held in memory, the cache DB is left untouched"""
+        with self._memo_lock:
+            self._series_memo.clear()
+            self._issue_memo.clear()
+
     def check_create_index(self) -> None:
+        # Called before every query, once the indices are known to exist there is nothing to do
+        if self.has_indices:
+            return
+
         self.check_db_filename_not_empty()
 
-        # Without this index the current issue list query is VERY slow
-        if not self.has_issue_id_type_id_index:
-            try:
-                with sqlite3.connect(self.db_file) as con:
-                    con.row_factory = sqlite3.Row
-                    con.text_factory = str
-                    cur = con.cursor()
+        # Without these indices the issue list and issue number queries are VERY slow
+        indices: dict[str, str] = {
+            "idx_issue_series_number": "CREATE INDEX IF NOT EXISTS idx_issue_series_number "
+            "ON gcd_issue (series_id, number);",
+            "idx_series_publisher": "CREATE INDEX IF NOT EXISTS idx_series_publisher ON gcd_series (publisher_id);",
+            "idx_series_name_nocase": "CREATE INDEX IF NOT EXISTS idx_series_name_nocase "
+            "ON gcd_series (name COLLATE NOCASE);",
+            # Serves every gcd_story join (issue_id then type_id) and covers the story titles of the issue list queries
+            # so their gcd_story rows are never read. sequence_number is only there to keep the ORDER BY covered, the
+            # ordering by issue then story sequence still takes a temporary b-tree
+            "idx_story_issue_type_title": "CREATE INDEX IF NOT EXISTS idx_story_issue_type_title "
+            "ON gcd_story (issue_id, type_id, sequence_number, title);",
+        }
+        # Lookups done by the single issue queries, dumps may already index these under another name
+        lookup_indices: dict[str, tuple[str, str]] = {
+            "idx_issue_credit_issue": ("gcd_issue_credit", "issue_id"),
+            "idx_story_credit_story": ("gcd_story_credit", "story_id"),
+            "idx_brand_emblem_group_brand": ("gcd_brand_emblem_group", "brand_id"),
+        }
 
-                    cur.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'issue_id_on_type_id';")
+        try:
+            with self._conn_lock, self._connect() as con:
+                # Another thread may have created them while this one waited for the lock
+                if self.has_indices:
+                    return
 
-                    if cur.fetchone():
-                        self.has_issue_id_type_id_index = True
-                    else:
-                        # Create the index
-                        cur.execute("CREATE INDEX issue_id_on_type_id ON gcd_story (type_id, issue_id);")
-                        self.has_issue_id_type_id_index = True
+                cur = con.cursor()
 
-            except sqlite3.DataError as e:
-                logger.debug(f"DB data error: {e}")
-                raise TalkerDataError(self.name, 1, str(e))
-            except sqlite3.Error as e:
-                logger.debug(f"DB error: {e}")
-                raise TalkerDataError(self.name, 0, str(e))
+                cur.execute("SELECT name FROM sqlite_master WHERE type = 'index';")
+                existing = {row["name"] for row in cur}
+                missing = [sql for name, sql in indices.items() if name not in existing]
+                for name, (table, column) in lookup_indices.items():
+                    if name not in existing and not self._has_leading_index(con, table, column):
+                        missing.append(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column});")
+
+                if missing:
+                    logger.info(f"Creating {len(missing)} missing index(es), this may take some time")
+                    cur.execute("BEGIN;")
+                    for sql in missing:
+                        cur.execute(sql)
+                    cur.execute("COMMIT;")
+                    # Update the statistics so the query planner makes use of the new indices
+                    cur.execute("ANALYZE;")
+
+                self.has_indices = True
+
+        except sqlite3.DataError as e:
+            logger.debug(f"DB data error: {e}")
+            raise TalkerDataError(self.name, 1, str(e))
+        except sqlite3.Error as e:
+            logger.debug(f"DB error: {e}")
+            raise TalkerDataError(self.name, 0, str(e))
+
+    def _has_leading_index(self, con: sqlite3.Connection, table: str, column: str) -> bool:
+        """Check if any index on the table starts with the column"""
+        for index in con.execute(f"PRAGMA index_list({table});").fetchall():
+            first_column = con.execute(f"PRAGMA index_info({index['name']});").fetchone()
+            if first_column is not None and first_column["name"] == column:
+                return True
+
+        return False
 
     def check_db_filename_not_empty(self) -> None:
         if not self.db_file:
@@ -286,39 +673,29 @@ class GCDTalker(ComicTalker):
 
     def check_db_fts5(self) -> None:
         try:
-            with sqlite3.connect(self.db_file) as con:
-                con = sqlite3.connect(":memory:")
+            with self._conn_lock, self._connect() as con:
                 cur = con.cursor()
-                cur.execute("pragma compile_options;")
+                cur.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5');")
 
-                if ("ENABLE_FTS5",) not in cur.fetchall():
+                if not cur.fetchone()[0]:
                     logger.debug("SQLite has no FTS5 support!")
                     self.has_fts5_checked = True
                     return
 
-        except sqlite3.Error as e:
-            logger.debug(f"DB error: {e}")
-            raise TalkerDataError(self.name, 0, str(e))
-
-        try:
-            with sqlite3.connect(self.db_file) as con:
-                con.row_factory = sqlite3.Row
-                con.text_factory = str
-                cur = con.cursor()
                 cur.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'fts';")
 
-                if cur.fetchone():
-                    self.has_fts5 = True
-                    self.has_fts5_checked = True
-                    return
-                else:
-                    # Create the FTS5 table
+                if not cur.fetchone():
+                    # Create the FTS5 table, a one time cost per database
+                    logger.info("Building full-text search index for series names")
                     cur.execute(
                         "CREATE VIRTUAL TABLE fts USING fts5(name, content='gcd_series', content_rowid='id', "
                         "tokenize = 'porter unicode61 remove_diacritics 1');"
                     )
                     cur.execute("INSERT INTO fts(fts) VALUES('rebuild');")
 
+                self.has_fts5 = True
+                self.has_fts5_checked = True
+
         except sqlite3.DataError as e:
             logger.debug(f"DB data error: {e}")
             raise TalkerDataError(self.name, 1, str(e))
@@ -335,36 +712,19 @@ class GCDTalker(ComicTalker):
         series_match_thresh: int = 90,
     ) -> list[ComicSeries]:
         sql_search: str = ""
-        sql_search_fields: str = """SELECT gcd_series.id AS 'id', gcd_series.name AS 'series_name',
-                            gcd_series.sort_name AS 'sort_name', gcd_series.notes AS 'notes',
-                            gcd_series.year_began AS 'year_began', gcd_series.year_ended AS 'year_ended',
-                            gcd_series.issue_count AS 'issue_count', gcd_publisher.name AS 'publisher_name' """
-
-        sql_literal_search: str = """FROM gcd_publisher
-                    LEFT JOIN gcd_series ON gcd_series.publisher_id=gcd_publisher.id
-                    WHERE gcd_series.name = ?"""
 
-        sql_like_search: str = """FROM gcd_publisher
-                    LEFT JOIN gcd_series ON gcd_series.publisher_id=gcd_publisher.id
-                    WHERE gcd_series.name LIKE ?"""
-
-        sql_ft_search: str = """FROM fts
-                    LEFT JOIN gcd_series on fts.rowid=gcd_series.id
-                    LEFT JOIN gcd_publisher ON gcd_series.publisher_id=gcd_publisher.id
-                    WHERE fts MATCH ?;"""
-
-        self.check_db_filename_not_empty()
+        self.check_create_index()
         if not self.has_fts5_checked:
             self.check_db_fts5()
 
         search_series_name = series_name
         if literal:
             # This will be literally literal: "the" will not match "The" etc.
-            sql_search = sql_search_fields + sql_literal_search
+            sql_search = _SQL_SEARCH_SERIES_LITERAL
         elif not self.has_fts5:
             # Make the search fuzzier
             search_series_name = search_series_name.replace(" ", "%") + "%"
-            sql_search = sql_search_fields + sql_like_search
+            sql_search = _SQL_SEARCH_SERIES_LIKE
         else:
             # Order is important
             # Escape any single and double quotes
@@ -375,33 +735,31 @@ class GCDTalker(ComicTalker):
             search_series_name = search_series_name.replace(" ", '" "')
 
             # Use FTS5 for search
-            sql_search = sql_search_fields + sql_ft_search
+            sql_search = _SQL_SEARCH_SERIES_FTS
 
         results = []
 
         logger.info(f"{self.name} searching: {search_series_name}")
 
         try:
-            with sqlite3.connect(self.db_file) as con:
-                con.row_factory = sqlite3.Row
-                con.text_factory = str
+            with self._conn_lock, self._connect() as con:
                 cur = con.cursor()
+                # Searches can return thousands of rows, skip sqlite3.Row and its lookups by name
+                cur.row_factory = None
                 cur.execute(
                     sql_search,
                     [search_series_name],
                 )
-                rows = cur.fetchall()
-
-                for record in rows:
+                for record in cur:
                     result = GCDSeries(
-                        id=record["id"],
-                        name=record["series_name"],
-                        sort_name=record["sort_name"],
-                        notes=record["notes"],
-                        year_began=record["year_began"],
-                        year_ended=record["year_ended"],
-                        count_of_issues=record["issue_count"],
-                        publisher_name=record["publisher_name"],
+                        id=record[_SEARCH_COL_ID],
+                        name=record[_SEARCH_COL_NAME],
+                        sort_name=record[_SEARCH_COL_SORT_NAME],
+                        notes=record[_SEARCH_COL_NOTES],
+                        year_began=record[_SEARCH_COL_YEAR_BEGAN],
+                        year_ended=record[_SEARCH_COL_YEAR_ENDED],
+                        count_of_issues=record[_SEARCH_COL_ISSUE_COUNT],
+                        publisher_name=record[_SEARCH_COL_PUBLISHER],
                         format="",
                         image="",
                         cover_downloaded=False,
@@ -433,37 +791,104 @@ class GCDTalker(ComicTalker):
 
         return comic_data
 
+    def fetch_comics(self, *, issue_ids: list[str]) -> list[GenericMetadata]:
+        """Fetch several full issues at once, issues that are not found are left out"""
+        self.check_db_filename_not_empty()
+
+        # Remove any duplicate IDs while keeping the requested order
+        gcd_issue_ids = list(dict.fromkeys(int(issue_id) for issue_id in issue_ids))
+
+        cvc = self._cacher()
+        issues: dict[int, GCDIssue] = {}
+        for issue_id in gcd_issue_ids:
+            cached_issue = self._get_cached_issue(cvc, issue_id)
+            if cached_issue is not None:
+                issues[issue_id] = cached_issue
+
+        uncached_ids = [issue_id for issue_id in gcd_issue_ids if issue_id not in issues]
+        if uncached_ids:
+            self.check_create_index()
+
+            try:
+                with self._conn_lock, self._connect() as con:
+                    cur = con.cursor()
+
+                    rows: list[sqlite3.Row] = []
+                    for batch in _batched(uncached_ids):
+                        cur.execute(
+                            _SQL_ISSUES_BY_ID.format(",".join("?" * len(batch))),
+                            batch,
+                        )
+                        rows.extend(cur.fetchall())
+
+                    new_issues = [self._complete_issue(cur, cvc, row) for row in rows]
+
+            except sqlite3.DataError as e:
+                logger.debug(f"DB data error: {e}")
+                raise TalkerDataError(self.name, 1, str(e))
+            except sqlite3.Error as e:
+                logger.debug(f"DB error: {e}")
+                raise TalkerDataError(self.name, 0, str(e))
+
+            # Download covers once the GCD connection is free for other threads, overlapping the page requests
+            covers: dict[int, tuple[str, list[str]] | None] = {}
+            if self._wants_issue_covers():
+                new_ids = [issue["id"] for issue in new_issues]
+                with concurrent.futures.ThreadPoolExecutor(max_workers=_COVER_WORKERS) as executor:
+                    covers = dict(zip(new_ids, executor.map(self._find_issue_images, new_ids)))
+
+            for issue in new_issues:
+                issues[issue["id"]] = self._finish_issue(issue, covers.get(issue["id"]))
+
+        series_data = self._fetch_series_data_batch(list(dict.fromkeys(x["series_id"] for x in issues.values())))
+
+        return [
+            self._map_comic_issue_to_metadata(issues[issue_id], series_data[issues[issue_id]["series_id"]])
+            for issue_id in gcd_issue_ids
+            if issue_id in issues and issues[issue_id]["series_id"] in series_data
+        ]
+
     def fetch_issues_in_series(self, series_id: str) -> list[GenericMetadata]:
-        series = self._fetch_series_data(int(series_id))
+        gcd_series_id = int(series_id)
+
+        # before we search online, look in our cache, since we might already have this info
+        cvc = self._cacher()
+        cached_series_issues_result = cvc.get_series_issues_info(series_id, self.id)
+
+        if cached_series_issues_result:
+            # Only the issue count is needed to know if the cache is whole, so avoid fetching the series for it
+            cached_series = self._series_memo.get(gcd_series_id)
+            if cached_series is None:
+                cached_series_info = cvc.get_series_info(series_id, self.id)
+                if cached_series_info is not None and cached_series_info[1]:
+                    cached_series = _cache_loads(cached_series_info[0].data)
+
+            if cached_series is not None:
+                # Full fetches also cache variants, which the series issue count leaves out. Entries cached before
+                # variant_of_id was stored can't be told apart so they don't count as a whole series
+                cached_issues: list[GCDIssue] = [_cache_loads(x[0].data) for x in cached_series_issues_result]
+                if all("variant_of_id" in x for x in cached_issues):
+                    cached_issues = [x for x in cached_issues if x["variant_of_id"] is None]
+                    if len(cached_issues) == cached_series["count_of_issues"]:
+                        cached_issues.sort(key=lambda x: x["id"])
+                        return [self._map_comic_issue_to_metadata(x, cached_series) for x in cached_issues]
 
         results: list[GCDIssue] = []
 
         self.check_create_index()
 
         try:
-            with sqlite3.connect(self.db_file) as con:
-                con.row_factory = sqlite3.Row
-                con.text_factory = str
+            with self._conn_lock, self._connect() as con:
                 cur = con.cursor()
                 cur.execute(
-                    "SELECT gcd_issue.id AS 'id', gcd_issue.number AS 'number', gcd_issue.key_date AS 'key_date',"
-                    " gcd_issue.title AS 'issue_title', gcd_issue.series_id AS 'series_id', "
-                    "GROUP_CONCAT(CASE WHEN gcd_story.title IS NOT NULL AND gcd_story.title != '' THEN "
-                    "gcd_story.sequence_number || '::' || gcd_story.title END, '\n') AS 'story_titles' "
-                    "FROM gcd_issue "
-                    "LEFT JOIN gcd_story ON gcd_story.issue_id = gcd_issue.id AND gcd_story.type_id = 19 "
-                    "WHERE gcd_issue.series_id = ? AND gcd_issue.variant_of_id IS NULL "
-                    "GROUP BY gcd_issue.id;",
-                    [int(series_id)],
+                    _SQL_ISSUES_IN_SERIES,
+                    [gcd_series_id],
                 )
-                rows = cur.fetchall()
 
-                if rows:
-                    for record in rows:
-                        results.append(self._format_gcd_issue(record))
+                results = self._format_gcd_issues_with_stories(cur)
 
                 # No issue(s) found
-                else:
+                if not results:
                     return [GenericMetadata()]
 
         except sqlite3.DataError as e:
@@ -473,6 +898,21 @@ class GCDTalker(ComicTalker):
             logger.debug(f"DB error: {e}")
             raise TalkerDataError(self.name, 0, str(e))
 
+        cvc.add_issues_info(
+            self.id,
+            [
+                CCIssue(
+                    id=str(x["id"]),
+                    series_id=str(x["series_id"]),
+                    data=_cache_dumps(x),
+                )
+                for x in results
+            ],
+            False,
+        )
+
+        series = self._fetch_series_data(gcd_series_id)
+
         formatted_series_issues_result = [self._map_comic_issue_to_metadata(x, series) for x in results]
 
         return formatted_series_issues_result
@@ -489,54 +929,28 @@ class GCDTalker(ComicTalker):
 
         sql_search: str = ""
 
-        sql_search_main: str = """SELECT gcd_issue.id AS 'id', gcd_issue.key_date AS 'key_date', gcd_issue.number AS
-                        'number', gcd_issue.title AS 'issue_title', gcd_issue.series_id AS 'series_id',
-                        GROUP_CONCAT(CASE WHEN gcd_story.title IS NOT NULL AND gcd_story.title != '' THEN
-                        gcd_story.sequence_number || '::' || gcd_story.title END, '\n') AS 'story_titles'
-                        FROM gcd_issue
-                        LEFT JOIN gcd_story ON gcd_story.issue_id=gcd_issue.id AND gcd_story.type_id=19
-                        WHERE gcd_issue.series_id=? AND gcd_issue.variant_of_id IS NULL """
-
-        sql_search_issues: str = "AND gcd_issue.number=? AND (gcd_issue.key_date LIKE ? OR gcd_issue.key_date='') "
-
-        sql_search_issues_nn: str = """AND (gcd_issue.number=? OR gcd_issue.number='[nn]') AND
-                        (gcd_issue.key_date LIKE ? OR gcd_issue.key_date='') """
-
-        sql_search_group: str = "GROUP BY gcd_issue.id;"
+        # Remove any duplicate IDs while keeping the requested order
+        series_ids = list(dict.fromkeys(int(vid) for vid in series_id_list))
 
         if self.nn_is_issue_one and issue_number == "1":
-            sql_search = sql_search_main + sql_search_issues_nn + sql_search_group
+            sql_search = _SQL_ISSUES_BY_NUMBER_NN
         else:
-            sql_search = sql_search_main + sql_search_issues + sql_search_group
+            sql_search = _SQL_ISSUES_BY_NUMBER
+
+        series_issues: dict[int, list[GCDIssue]] = {series_id: [] for series_id in series_ids}
 
         try:
-            with sqlite3.connect(self.db_file) as con:
-                con.row_factory = sqlite3.Row
-                con.text_factory = str
+            with self._conn_lock, self._connect() as con:
                 cur = con.cursor()
 
-                for vid in series_id_list:
-                    series = self._fetch_series_data(int(vid))
-
+                for batch in _batched(series_ids):
                     cur.execute(
-                        sql_search,
-                        [vid, issue_number, year_search],
+                        sql_search.format(",".join("?" * len(batch))),
+                        [*batch, issue_number, year_search],
                     )
 
-                    rows = cur.fetchall()
-
-                    if rows:
-                        for record in rows:
-                            issue = self._format_gcd_issue(record)
-
-                            # Download covers for matching
-                            if self.download_tag_covers:
-                                image, variants = self._find_issue_images(issue["id"])
-                                issue["image"] = image
-                                issue["alt_image_urls"] = variants
-                                issue["covers_downloaded"] = True
-
-                            results.append(self._map_comic_issue_to_metadata(issue, series))
+                    for issue in self._format_gcd_issues_with_stories(cur):
+                        series_issues[issue["series_id"]].append(issue)
 
         except sqlite3.DataError as e:
             logger.debug(f"DB data error: {e}")
@@ -545,21 +959,27 @@ class GCDTalker(ComicTalker):
             logger.debug(f"DB error: {e}")
             raise TalkerDataError(self.name, 0, str(e))
 
-        return results
-
-    def _split_issue_titles(self, concated_titles: str) -> list[str]:
-        titles_matrix: list[list[str]] = []
-        if concated_titles:
-            titles = concated_titles.split("\n")
-
-            for title in titles:
-                split_title = title.split("::")
-                titles_matrix.append([split_title[0], split_title[1]])
-            titles_matrix.sort()
+        # Download covers for matching, overlapping the page requests
+        if self.download_tag_covers:
+            issues = [issue for issues in series_issues.values() for issue in issues]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=_COVER_WORKERS) as executor:
+                for issue, covers in zip(
+                    issues, executor.map(self._find_issue_images, [issue["id"] for issue in issues])
+                ):
+                    # A failed scrape leaves covers_downloaded False so it is tried again
+                    if covers is not None:
+                        issue["image"], issue["alt_image_urls"] = covers
+                        issue["covers_downloaded"] = True
+
+        # Only fetch the series that have matching issues
+        series_data = self._fetch_series_data_batch([series_id for series_id in series_ids if series_issues[series_id]])
+
+        # As in fetch_comics, issues are skipped if their series row is missing
+        for series_id, issues in series_issues.items():
+            if series_id in series_data:
+                results.extend(self._map_comic_issue_to_metadata(issue, series_data[series_id]) for issue in issues)
 
-            return [title_mat[1] for title_mat in titles_matrix]
-
-        return []
+        return results
 
     def _match_format(self, string: str) -> str | None:
         # The publishing_format field is a free-text mess, try and make something useful
@@ -590,41 +1010,29 @@ class GCDTalker(ComicTalker):
         else:
             return None
 
-    def _find_series_image(self, con: sqlite3.Connection, series_id: int) -> str:
-        """Find the id of the first issue and get the image url"""
-        issue_id = None
+    def _find_series_image(self, issue_id: int | None) -> str | None:
+        """Get the image url of the series' first issue, None if the scrape failed"""
         cover = ""
-        try:
-            con.row_factory = sqlite3.Row
-            con.text_factory = str
-            cur = con.cursor()
-
-            cur.execute(
-                "SELECT gcd_series.first_issue_id " "FROM gcd_series " "WHERE gcd_series.id=?",
-                [series_id],
-            )
-            issue_id = cur.fetchone()[0]
-
-        except sqlite3.DataError as e:
-            logger.debug(f"DB data error: {e}")
-            raise TalkerDataError(self.name, 1, str(e))
-        except sqlite3.Error as e:
-            logger.debug(f"DB error: {e}")
-            raise TalkerDataError(self.name, 0, str(e))
-
         if issue_id:
-            cover, _ = self._find_issue_images(issue_id)
+            covers = self._find_issue_images(issue_id)
+            if covers is None:
+                return None
+            cover = covers[0]
 
         return cover
 
-    def _find_issue_images(self, issue_id: int) -> tuple[str, list[str]]:
-        """Fetch images for the issue id"""
+    def _find_issue_images(self, issue_id: int) -> tuple[str, list[str]] | None:
+        """Fetch images for the issue id, None if GCD didn't serve the covers page and it's worth trying again"""
         cover = ""
-        variants = []
+        variants: list[str] = []
+
+        cached_images = self._get_cached_issue_images(issue_id)
+        if cached_images is not None:
+            return cached_images
 
         with limiter.ratelimit("default", delay=True):
             try:
-                covers_html = requests.get(f"{self.website}/issue/{issue_id}/cover/4").text
+                resp = self._session.get(f"{self.website}/issue/{issue_id}/cover/4")
             except requests.exceptions.Timeout:
                 logger.debug(f"Connection to {self.website} timed out.")
                 raise TalkerNetworkError(self.website, 4)
@@ -632,70 +1040,128 @@ class GCDTalker(ComicTalker):
                 logger.debug(f"Request exception: {e}")
                 raise TalkerNetworkError(self.website, 0, str(e)) from e
 
-        covers_page = BeautifulSoup(covers_html, "html.parser")
+        # An error page says nothing about the covers either, only a 200 is worth caching
+        if resp.status_code != requests.codes.ok:
+            logger.info(f"Cover page for ID: {issue_id} returned HTTP {resp.status_code}")
+            return None
 
-        img_list = covers_page.findAll("img", "cover_img")
+        img_list, cf_challenge = self._parse_covers_page(resp.text)
 
         if len(img_list) > 0:
-            for i, image in enumerate(img_list):
-                # Strip arbitrary number from end for cache
-                src = image.get("src").split("?")[0]
-                if i == 0:
-                    cover = src
-                else:
-                    variants.append(src)
+            # Strip arbitrary number from end for cache
+            srcs = [src.split("?")[0] for src in img_list]
+            cover = srcs[0]
+            variants = srcs[1:]
         else:
-            cf_challenge = covers_page.findAll(id="challenge-error-title")
             if cf_challenge:
                 logger.info(f"CloudFlare active, cannot access image for ID: {issue_id}")
             else:
                 logger.info(f"No image found for ID: {issue_id}")
 
+        # A CloudFlare challenge says nothing about the covers, so try again next time
+        if cf_challenge:
+            return None
+
+        self._cache_issue_images(issue_id, cover, variants)
+
         return cover, variants
 
-    def _find_issue_credits(self, con: sqlite3.Connection, issue_id: int, story_id_list: list[str]) -> list[GCDCredit]:
-        credit_results = []
-        # First get the issue table credits
-        try:
-            con.row_factory = sqlite3.Row
-            con.text_factory = str
-            cur = con.cursor()
-            cur.execute(
-                "SELECT gcd_issue_credit.credit_name AS 'role', gcd_creator_name_detail.name "
-                "FROM gcd_issue_credit "
-                "INNER JOIN gcd_creator_name_detail ON gcd_issue_credit.creator_id=gcd_creator_name_detail.id "
-                "WHERE gcd_issue_credit.issue_id=?",
-                [issue_id],
-            )
-            rows = cur.fetchall()
+    def _check_create_cover_cache(self) -> None:
+        if not self.has_cover_cache:
+            with sqlite3.connect(self.cover_cache_file) as con:
+                cur = con.cursor()
+                # Cover scrapes run in parallel, WAL lets their writes and the lookups of other threads overlap
+                cur.execute("PRAGMA journal_mode=WAL;")
+                cur.execute(
+                    "CREATE TABLE IF NOT EXISTS gcd_cover_cache (issue_id INTEGER PRIMARY KEY, cover TEXT, "
+                    "variants TEXT, fetched_at INTEGER);"
+                )
+                cur.execute("CREATE INDEX IF NOT EXISTS fetched_at ON gcd_cover_cache (fetched_at);")
 
-            for record in rows:
-                result = GCDCredit(
-                    name=record[1],
-                    gcd_role=record[0],
+            self.has_cover_cache = True
+
+    def _get_cached_issue_images(self, issue_id: int) -> tuple[str, list[str]] | None:
+        """Return the previously scraped cover and variants for the issue id, if still fresh"""
+        try:
+            self._check_create_cover_cache()
+            with sqlite3.connect(self.cover_cache_file) as con:
+                cur = con.cursor()
+                cur.execute(
+                    "SELECT cover, variants FROM gcd_cover_cache WHERE issue_id=? AND fetched_at>?",
+                    [issue_id, int(time.time()) - _COVER_CACHE_TTL],
                 )
+                row = cur.fetchone()
 
-                credit_results.append(result)
+        except sqlite3.Error as e:
+            logger.debug(f"Cover cache error: {e}")
+            return None
 
-            # Get story table credits
-            for story_id in story_id_list:
+        if row is None:
+            return None
+
+        return row[0], json.loads(row[1])
+
+    def _cache_issue_images(self, issue_id: int, cover: str, variants: list[str]) -> None:
+        try:
+            self._check_create_cover_cache()
+            with sqlite3.connect(self.cover_cache_file) as con:
+                cur = con.cursor()
+                # Losing the last few scrapes on power loss only means fetching them again
+                cur.execute("PRAGMA synchronous=NORMAL;")
                 cur.execute(
-                    "SELECT gcd_creator_name_detail.name, gcd_credit_type.name "
-                    "FROM gcd_story_credit "
-                    "INNER JOIN gcd_credit_type ON gcd_credit_type.id=gcd_story_credit.credit_type_id "
-                    "INNER JOIN gcd_creator_name_detail ON gcd_creator_name_detail.id=gcd_story_credit.creator_id "
-                    "WHERE gcd_story_credit.story_id=?",
-                    [int(story_id)],
+                    "INSERT OR REPLACE INTO gcd_cover_cache (issue_id, cover, variants, fetched_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    [issue_id, cover, json.dumps(variants), int(time.time())],
+                )
+                # Keep only the most recently scraped issues
+                cur.execute(
+                    "DELETE FROM gcd_cover_cache WHERE issue_id IN "
+                    "(SELECT issue_id FROM gcd_cover_cache ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                    [_COVER_CACHE_SIZE],
                 )
-                rows = cur.fetchall()
 
-                for record in rows:
-                    result = GCDCredit(
-                        name=record[0],
-                        gcd_role=record[1],
-                    )
+        except sqlite3.Error as e:
+            logger.debug(f"Cover cache error: {e}")
+
+    def _parse_covers_page(self, covers_html: str) -> tuple[list[str], bool]:
+        """Return the cover image URLs and whether a CloudFlare challenge was served instead"""
+        if has_lxml:
+            try:
+                covers_page = lxml.html.fromstring(covers_html)
+            except lxml.etree.ParserError:
+                # "Document is empty", a blank or comment only body has nothing to find
+                return [], False
+            # An attribute path always selects a list of strings
+            img_list = cast(
+                list[str],
+                covers_page.xpath('//img[contains(concat(" ", normalize-space(@class), " "), " cover_img ")]/@src'),
+            )
+            cf_challenge = bool(covers_page.xpath('//*[@id="challenge-error-title"]'))
+        else:
+            soup = BeautifulSoup(covers_html, "html.parser")
+            img_list = [str(image["src"]) for image in soup.find_all("img", class_="cover_img") if image.get("src")]
+            cf_challenge = bool(soup.find_all(id="challenge-error-title"))
 
-                    credit_results.append(result)
+        return img_list, cf_challenge
+
+    def _find_issue_credits(self, cur: sqlite3.Cursor, issue_id: int, story_id_list: list[str]) -> list[GCDCredit]:
+        credit_results = []
+        # Issue table credits and story table credits (using story_id) in one round-trip
+        sql_search = _SQL_ISSUE_CREDITS_BY_ISSUE
+        params = [issue_id]
+        if story_id_list:
+            sql_search += _SQL_ISSUE_CREDITS_BY_STORY.format(",".join("?" * len(story_id_list)))
+            params.extend(int(story_id) for story_id in story_id_list)
+
+        try:
+            cur.execute(sql_search, params)
+            for record in cur:
+                result = GCDCredit(
+                    name=record[0],
+                    gcd_role=record[1],
+                )
+
+                credit_results.append(result)
 
         except sqlite3.DataError as e:
             logger.debug(f"DB data error: {e}")
@@ -727,109 +1193,120 @@ class GCDTalker(ComicTalker):
 
         return formatted_results
 
+    def _format_gcd_issues_with_stories(self, cur: sqlite3.Cursor) -> list[GCDIssue]:
+        """Format rows of issue columns plus a story title, one row per story ordered by issue then story sequence"""
+        results: list[GCDIssue] = []
+
+        # Gather the story titles as the rows stream in rather than concatenating and splitting them again
+        for _, issue_rows in itertools.groupby(cur, key=operator.itemgetter("id")):
+            records = list(issue_rows)
+            issue = self._format_gcd_issue(records[0])
+            issue["story_titles"] = [record["story_title"] for record in records if record["story_title"]]
+            results.append(issue)
+
+        return results
+
     def _format_gcd_issue(self, row: sqlite3.Row, complete: bool = False) -> GCDIssue:
-        # Convert for attribute access
-        row_dict = dict(row)
-
-        gcd_issue = GCDIssue(
-            id=row_dict["id"],
-            key_date=row_dict["key_date"],
-            number=row_dict["number"],
-            issue_title=row_dict["issue_title"],
-            series_id=row_dict["series_id"],
-            story_titles=self._split_issue_titles(row_dict["story_titles"]),
-            synopses=(
-                row_dict["synopses"].split("\n\n")
-                if "synopses" in row_dict and row_dict["synopses"] is not None
-                else []
-            ),
-            image="",
-            alt_image_urls=[],
-            covers_downloaded=False,
-        )
+        columns = row.keys()
+        simple_columns = _ISSUE_COLUMNS + _ISSUE_COMPLETE_COLUMNS if complete else _ISSUE_COLUMNS
+        split_columns = _ISSUE_COMPLETE_SPLIT_COLUMNS if complete else ()
+
+        gcd_issue: dict[str, Any] = {key: row[key] for key in simple_columns}
+
+        for key, separator in split_columns:
+            value = row[key] if key in columns else None
+            gcd_issue[key] = value.split(separator) if value else []
+
+        gcd_issue["story_titles"] = []
+        gcd_issue["synopses"] = []
+        gcd_issue["story_descriptions"] = []
+        gcd_issue["image"] = ""
+        gcd_issue["alt_image_urls"] = []
+        gcd_issue["covers_downloaded"] = False
 
         if complete:
-            gcd_issue["issue_notes"] = row_dict["issue_notes"]
-            gcd_issue["volume"] = row_dict["volume"]
-            gcd_issue["price"] = row_dict["price"]
-            gcd_issue["isbn"] = row_dict["isbn"]
-            gcd_issue["imprint"] = row_dict["imprint"]
-            gcd_issue["maturity_rating"] = row_dict["maturity_rating"]
-            gcd_issue["characters"] = (
-                row_dict["characters"].split("; ") if "characters" in row_dict and row_dict["characters"] else []
-            )
-            gcd_issue["country"] = row_dict["country"]
-            gcd_issue["country_iso"] = row_dict["country_iso"]
-            gcd_issue["story_ids"] = (
-                row_dict["story_ids"].split("\n") if "story_ids" in row_dict and row_dict["story_ids"] else []
-            )
-            gcd_issue["language"] = row_dict["language"]
-            gcd_issue["language_iso"] = row_dict["language_iso"]
-            gcd_issue["genres"] = (
-                [genre.strip().capitalize() for genre in row_dict.get("genres", "").split(";")]
-                if "genres" in row_dict and row_dict["genres"]
-                else []
-            )
+            self._format_gcd_stories(gcd_issue, row["stories"])
             gcd_issue["credits"] = []
 
-        return gcd_issue
+        return cast(GCDIssue, gcd_issue)
+
+    def _format_gcd_stories(self, gcd_issue: dict[str, Any], stories_json: str) -> None:
+        """Add the story titles, synopses, genres and IDs from the JSON array of stories"""
+        # Without _SQL_STORIES_FILTER an issue without stories still has its one LEFT JOIN row, all NULL
+        stories = [story for story in json.loads(stories_json) if story["id"] is not None]
+        stories.sort(key=lambda story: story["sequence_number"] or 0)
+
+        gcd_issue["story_titles"] = [story["title"] for story in stories if story["title"]]
+        gcd_issue["synopses"] = [story["synopsis"] for story in stories if story["synopsis"]]
+        # Pair each synopsis with its title here, once the lists above are filtered they no longer line up
+        gcd_issue["story_descriptions"] = [
+            f"{story['title']}: {story['synopsis']}" if story["title"] else story["synopsis"]
+            for story in stories
+            if story["synopsis"]
+        ]
+        gcd_issue["story_ids"] = [str(story["id"]) for story in stories]
+        # Each story's genre is itself semicolon separated
+        gcd_issue["genres"] = [
+            genre.strip().capitalize() for story in stories if story["genre"] for genre in story["genre"].split(";")
+        ]
 
     def fetch_series(self, series_id: str) -> ComicSeries:
         return self._format_search_results([self._fetch_series_data(int(series_id))])[0]
 
     def _fetch_series_data(self, series_id: int) -> GCDSeries:
-        cvc = ComicCacher(self.cache_folder, self.version)
-        cached_series = cvc.get_series_info(str(series_id), self.id)
+        series = self._fetch_series_data_batch([series_id])
 
-        if cached_series is not None and cached_series[1]:
-            cache = json.loads(cached_series[0].data)
-            # Even though the cache is "complete", downloading the cover is an option
-            if self.download_gui_covers and cache["cover_downloaded"]:
-                return cache
-            elif not self.download_gui_covers:
-                return cache
-            # While an else could go here to fetch the cover, might as well refresh all the data
+        if series_id not in series:
+            logger.debug(f"Series ID {series_id} not found")
+            raise TalkerDataError(self.name, 3, f"Series ID {series_id} not found")
 
-        try:
-            with sqlite3.connect(self.db_file) as con:
-                con.row_factory = sqlite3.Row
-                con.text_factory = str
-                cur = con.cursor()
+        return series[series_id]
 
-                cur.execute(
-                    "SELECT gcd_series.id AS 'id', gcd_series.name AS 'series_name', "
-                    "gcd_series.sort_name AS 'sort_name', gcd_series.notes AS 'notes', "
-                    "gcd_series.year_began AS 'year_began', gcd_series.year_ended AS 'year_ended', "
-                    "gcd_series.issue_count AS 'issue_count', gcd_publisher.name AS 'publisher_name', "
-                    "gcd_series.country_id AS 'country_id', gcd_series.language_id AS 'lang_id', "
-                    "gcd_series.publishing_format AS 'format', gcd_series.is_current AS 'is_current' "
-                    "FROM gcd_publisher "
-                    "LEFT JOIN gcd_series ON gcd_series.publisher_id=gcd_publisher.id "
-                    "WHERE gcd_series.id=?",
-                    [series_id],
-                )
-                row = cur.fetchone()
+    def _fetch_series_data_batch(self, series_ids: list[int]) -> dict[int, GCDSeries]:
+        """Fetch multiple series, using the cache where possible and a single query for the rest"""
+        results: dict[int, GCDSeries] = {}
 
-                # Scrape GCD for series cover URL
-                image = ""
-                cover_download = False
-                if self.download_gui_covers:
-                    image = self._find_series_image(con, series_id)
-                    cover_download = True
+        with self._memo_lock:
+            for series_id in series_ids:
+                series = self._series_memo.get(series_id)
+                # A series remembered without its cover needs refreshing if covers are now wanted
+                if series is not None and (not self.download_gui_covers or series["cover_downloaded"]):
+                    self._series_memo.move_to_end(series_id)
+                    results[series_id] = series
 
-                result = GCDSeries(
-                    id=row["id"],
-                    name=row["series_name"],
-                    sort_name=row["sort_name"],
-                    notes=row["notes"],
-                    year_began=row["year_began"],
-                    year_ended=row["year_ended"],
-                    count_of_issues=row["issue_count"],
-                    publisher_name=row["publisher_name"],
-                    format=row["format"],
-                    image=image,
-                    cover_downloaded=cover_download,
-                )
+        cvc = self._cacher()
+
+        for series_id in series_ids:
+            if series_id in results:
+                continue
+
+            cached_series = cvc.get_series_info(str(series_id), self.id)
+
+            if cached_series is not None and cached_series[1]:
+                cache = _cache_loads(cached_series[0].data)
+                # Even though the cache is "complete", downloading the cover is an option
+                if self.download_gui_covers and cache["cover_downloaded"]:
+                    results[series_id] = self._remember_series(cache)
+                elif not self.download_gui_covers:
+                    results[series_id] = self._remember_series(cache)
+                # While an else could go here to fetch the cover, might as well refresh all the data
+
+        uncached_ids = [series_id for series_id in series_ids if series_id not in results]
+        if not uncached_ids:
+            return results
+
+        rows: list[sqlite3.Row] = []
+
+        try:
+            with self._conn_lock, self._connect() as con:
+                cur = con.cursor()
+
+                for batch in _batched(uncached_ids):
+                    cur.execute(
+                        _SQL_FETCH_SERIES.format(",".join("?" * len(batch))),
+                        batch,
+                    )
+                    rows.extend(cur.fetchall())
 
         except sqlite3.DataError as e:
             logger.debug(f"DB data error: {e}")
@@ -838,49 +1315,109 @@ class GCDTalker(ComicTalker):
             logger.debug(f"DB error: {e}")
             raise TalkerDataError(self.name, 0, str(e))
 
-        if result:
-            cvc.add_series_info(self.id, CCSeries(id=str(result["id"]), data=json.dumps(result).encode("utf-8")), True)
+        new_series: list[GCDSeries] = []
+
+        for row in rows:
+            # Scrape GCD for series cover URL, once the GCD connection is free for other threads
+            image = ""
+            cover_download = False
+            if self.download_gui_covers:
+                series_image = self._find_series_image(row["first_issue_id"])
+                if series_image is not None:
+                    image = series_image
+                    cover_download = True
+
+            result = self._format_gcd_series(row, row["id"], image, cover_download)
+
+            new_series.append(result)
+            results[result["id"]] = self._remember_series(result)
+
+        # Write to the cache once the GCD cursor is done rather than between rows
+        for series in new_series:
+            cvc.add_series_info(
+                self.id,
+                CCSeries(id=str(series["id"]), data=_cache_dumps(series)),
+                True,
+            )
+
+        return results
+
+    def _format_gcd_series(
+        self, row: sqlite3.Row, series_id: int, image: str = "", cover_downloaded: bool = False
+    ) -> GCDSeries:
+        return GCDSeries(
+            id=series_id,
+            name=row["series_name"],
+            sort_name=row["sort_name"],
+            notes=row["notes"],
+            year_began=row["year_began"],
+            year_ended=row["year_ended"],
+            count_of_issues=row["issue_count"],
+            publisher_name=row["publisher_name"],
+            format=row["format"],
+            image=image,
+            cover_downloaded=cover_downloaded,
+        )
+
+    def _remember_series(self, series: GCDSeries) -> GCDSeries:
+        """Keep the series in memory, dropping the least recently used once full"""
+        with self._memo_lock:
+            self._series_memo[series["id"]] = series
+            self._series_memo.move_to_end(series["id"])
+            if len(self._series_memo) > _SERIES_MEMO_SIZE:
+                self._series_memo.popitem(last=False)
+
+        return series
+
+    def _remember_issue(self, issue: GCDIssue) -> GCDIssue:
+        """Keep the fully fetched issue in memory, dropping the least recently used once full"""
+        with self._memo_lock:
+            self._issue_memo[issue["id"]] = issue
+            self._issue_memo.move_to_end(issue["id"])
+            if len(self._issue_memo) > _ISSUE_MEMO_SIZE:
+                self._issue_memo.popitem(last=False)
 
-        return result
+        return issue
 
     def _fetch_issue_data(self, series_id: int, issue_number: str) -> GenericMetadata:
-        # Find the id of the issue and pass it along
+        # Fetch the full issue by series and number in one go rather than looking up the id first
 
         sql_query: str = ""
-        sql_base: str = "SELECT gcd_issue.id AS 'id' FROM gcd_issue "
-        sql_where: str = "WHERE gcd_issue.series_id=? AND gcd_issue.number=? AND gcd_issue.variant_of_id IS NULL "
-        sql_where_nn: str = (
-            "WHERE gcd_issue.series_id=? AND gcd_issue.variant_of_id IS NULL AND "
-            "(gcd_issue.number=? OR gcd_issue.number='[nn]')"
-        )
+
+        self.check_create_index()
 
         if self.nn_is_issue_one and issue_number == "1":
-            sql_query = sql_base + sql_where_nn
+            sql_query = _SQL_ISSUE_BY_NUMBER_NN
         else:
-            sql_query = sql_base + sql_where
+            sql_query = _SQL_ISSUE_BY_NUMBER
 
         try:
-            with sqlite3.connect(self.db_file) as con:
-                con.row_factory = sqlite3.Row
-                con.text_factory = str
+            with self._conn_lock, self._connect() as con:
                 cur = con.cursor()
 
                 cur.execute(
                     sql_query,
                     [series_id, issue_number],
                 )
-                row = cur.fetchall()
+                rows = cur.fetchall()
+
+                if not rows:
+                    return GenericMetadata()
 
                 # Expect one result however there are exception: "nn" for issue number and new volumes restarting issue
                 # number back to 1 are possible therefore, take the first result and log the remainder
-                if len(row) > 1:
+                if len(rows) > 1:
                     logger.warning(
                         f"More than ONE issue found for: Series ID: {series_id}, Issue Number: "
                         f"{issue_number}. Using first result.\n"
-                        f"All result IDs: {', '.join([str(i_id['id']) for i_id in row])}"
+                        f"All result IDs: {', '.join([str(i_id['id']) for i_id in rows])}"
                     )
-                if row[0]["id"]:
-                    return self._fetch_issue_data_by_issue_id(row[0]["id"])
+
+                cvc = self._cacher()
+                issue = self._get_cached_issue(cvc, rows[0]["id"])
+                new_issue = issue is None
+                if issue is None:
+                    issue = self._complete_issue(cur, cvc, rows[0])
 
         except sqlite3.DataError as e:
             logger.debug(f"DB data error: {e}")
@@ -889,7 +1426,15 @@ class GCDTalker(ComicTalker):
             logger.debug(f"DB error: {e}")
             raise TalkerDataError(self.name, 0, str(e))
 
-        return GenericMetadata()
+        # Scrape the covers once the GCD connection is free for other threads
+        if new_issue:
+            issue = self._finish_issue(
+                issue, self._find_issue_images(issue["id"]) if self._wants_issue_covers() else None
+            )
+
+        series = self._fetch_series_data(issue["series_id"])
+
+        return self._map_comic_issue_to_metadata(issue, series)
 
     def _fetch_issue_data_by_issue_id(self, issue_id: int) -> GenericMetadata:
         issue = self._fetch_issue_by_issue_id(issue_id)
@@ -897,68 +1442,53 @@ class GCDTalker(ComicTalker):
 
         return self._map_comic_issue_to_metadata(issue, series)
 
-    def _fetch_issue_by_issue_id(self, issue_id: int) -> GCDIssue:
-        cvc = ComicCacher(self.cache_folder, self.version)
+    def _wants_issue_covers(self) -> bool:
+        # Issue covers are shown in the GUI and compared when auto-tagging
+        return self.download_gui_covers or self.download_tag_covers
+
+    def _get_cached_issue(self, cvc: ComicCacher, issue_id: int) -> GCDIssue | None:
+        # Recently fetched issues, including those still waiting to be written to the cache DB
+        with self._memo_lock:
+            memo_issue = self._issue_memo.get(issue_id)
+            if memo_issue is not None and (memo_issue["covers_downloaded"] or not self._wants_issue_covers()):
+                self._issue_memo.move_to_end(issue_id)
+                return memo_issue
+
         cached_issue = cvc.get_issue_info(str(issue_id), self.id)
 
         if cached_issue and cached_issue[1]:
-            cache = json.loads(cached_issue[0].data)
+            cache = _cache_loads(cached_issue[0].data)
             # Even though the cache is "complete", downloading the cover is an option
-            if self.download_gui_covers and cache["covers_downloaded"]:
-                return cache
-            elif not self.download_gui_covers:
-                return cache
+            if self._wants_issue_covers() and cache["covers_downloaded"]:
+                return self._remember_issue(cache)
+            elif not self._wants_issue_covers():
+                return self._remember_issue(cache)
             # While an else could go here to fetch the cover, might as well refresh all the data
 
+        return None
+
+    def _fetch_issue_by_issue_id(self, issue_id: int) -> GCDIssue:
+        cvc = self._cacher()
+        cached_issue = self._get_cached_issue(cvc, issue_id)
+
+        if cached_issue is not None:
+            return cached_issue
+
         # Need this one?
         self.check_create_index()
 
         try:
-            with sqlite3.connect(self.db_file) as con:
-                con.row_factory = sqlite3.Row
-                con.text_factory = str
+            with self._conn_lock, self._connect() as con:
                 cur = con.cursor()
 
                 cur.execute(
-                    "SELECT gcd_issue.id AS 'id', gcd_issue.key_date AS 'key_date', gcd_issue.number AS 'number', "
-                    "gcd_issue.title AS 'issue_title', gcd_issue.series_id AS 'series_id', "
-                    "gcd_issue.price AS 'price', gcd_issue.valid_isbn AS 'isbn', "
-                    "gcd_issue.notes AS 'issue_notes', gcd_issue.volume AS 'volume', "
-                    "gcd_issue.rating AS 'maturity_rating', gcd_story.characters AS 'characters', "
-                    "stddata_country.name AS 'country', stddata_country.code AS 'country_iso', "
-                    "stddata_language.name AS 'language', stddata_language.code AS 'language_iso', "
-                    "GROUP_CONCAT(CASE WHEN gcd_story.title IS NOT NULL AND gcd_story.title != '' THEN "
-                    "gcd_story.sequence_number || '::' || gcd_story.title END, '\n') AS 'story_titles',"
-                    "GROUP_CONCAT(CASE WHEN gcd_story.genre IS NOT NULL AND gcd_story.genre != '' THEN "
-                    "gcd_story.genre END, ';') AS 'genres',"
-                    "GROUP_CONCAT(CASE WHEN gcd_story.synopsis IS NOT NULL AND gcd_story.synopsis != '' THEN "
-                    "gcd_story.synopsis END,'\n\n') AS 'synopses', "
-                    "GROUP_CONCAT(CASE WHEN gcd_story.id IS NOT NULL AND gcd_story.id != '' THEN "
-                    "gcd_story.id END, '\n') AS 'story_ids', "
-                    "(SELECT GROUP_CONCAT(gcd_brand_group.name, '; ') "
-                    "from gcd_issue "
-                    "LEFT JOIN gcd_brand ON gcd_issue.brand_id=gcd_brand.id "
-                    "LEFT JOIN gcd_brand_emblem_group ON gcd_brand.id=gcd_brand_emblem_group.brand_id "
-                    "LEFT JOIN gcd_brand_group ON gcd_brand_emblem_group.brandgroup_id=gcd_brand_group.id "
-                    "LEFT JOIN gcd_series ON gcd_issue.series_id=gcd_series.id "
-                    "LEFT JOIN gcd_publisher ON gcd_series.publisher_id=gcd_publisher.id "
-                    "WHERE gcd_issue.id=? "
-                    "and gcd_publisher.name is not gcd_brand_group.name "
-                    ") as 'imprint' "
-                    "FROM gcd_issue "
-                    "LEFT JOIN gcd_story ON gcd_story.issue_id=gcd_issue.id AND gcd_story.type_id=19 "
-                    "LEFT JOIN gcd_indicia_publisher ON gcd_issue.indicia_publisher_id=gcd_indicia_publisher.id "
-                    "LEFT JOIN gcd_series ON gcd_issue.series_id=gcd_series.id "
-                    "LEFT JOIN stddata_country ON gcd_indicia_publisher.country_id=stddata_country.id "
-                    "LEFT JOIN stddata_language ON gcd_series.language_id=stddata_language.id "
-                    "WHERE gcd_issue.id=? "
-                    "GROUP BY gcd_issue.id",
-                    [issue_id, issue_id],
+                    _SQL_ISSUE,
+                    [issue_id],
                 )
                 row = cur.fetchone()
 
                 if row:
-                    issue_result = self._format_gcd_issue(row, True)
+                    issue_result = self._complete_issue(cur, cvc, row)
                 else:
                     logger.debug(f"Issue ID {issue_id} not found")
                     raise TalkerDataError(self.name, 3, f"Issue ID {issue_id} not found")
@@ -970,37 +1500,48 @@ class GCDTalker(ComicTalker):
             logger.debug(f"DB error: {e}")
             raise TalkerDataError(self.name, 0, str(e))
 
+        # Scrape the covers once the GCD connection is free for other threads
+        return self._finish_issue(
+            issue_result, self._find_issue_images(issue_result["id"]) if self._wants_issue_covers() else None
+        )
+
+    def _complete_issue(self, cur: sqlite3.Cursor, cvc: ComicCacher, row: sqlite3.Row) -> GCDIssue:
+        """Add credits to a full issue row, the row's cursor is reused for credits. See _finish_issue for the covers"""
+        issue_result = self._format_gcd_issue(row, True)
+
+        # The row carries the series too, which saves a query unless the series cover has to be scraped
+        if not self.download_gui_covers and issue_result["series_id"] not in self._series_memo:
+            series = self._format_gcd_series(row, issue_result["series_id"])
+            cvc.add_series_info(self.id, CCSeries(id=str(series["id"]), data=_cache_dumps(series)), True)
+            self._remember_series(series)
+
         # Add credits
-        issue_result["credits"] = self._find_issue_credits(con, issue_id, issue_result["story_ids"])
+        issue_result["credits"] = self._find_issue_credits(cur, issue_result["id"], issue_result["story_ids"])
+
+        return issue_result
+
+    def _finish_issue(self, issue_result: GCDIssue, covers: tuple[str, list[str]] | None) -> GCDIssue:
+        """Add the scraped covers to a completed issue and cache the result
 
-        # Add covers
-        if self.download_gui_covers:
-            image, variants = self._find_issue_images(issue_result["id"])
-            issue_result["image"] = image
-            issue_result["alt_image_urls"] = variants
+        Covers are None when they are not wanted or the scrape failed, either way covers_downloaded stays False so a
+        later fetch wanting covers tries again
+        """
+        if covers is not None:
+            issue_result["image"], issue_result["alt_image_urls"] = covers
             issue_result["covers_downloaded"] = True
         else:
             issue_result["covers_downloaded"] = False
 
-        cvc.add_issues_info(
-            self.id,
-            [
-                CCIssue(
-                    id=str(issue_result["id"]),
-                    series_id=str(issue_result["series_id"]),
-                    data=json.dumps(issue_result).encode("utf-8"),
-                )
-            ],
-            True,
-        )
+        self._queue_issue_cache(issue_result)
 
-        return issue_result
+        return self._remember_issue(issue_result)
 
     def _map_comic_issue_to_metadata(self, issue: GCDIssue, series: GCDSeries) -> GenericMetadata:
         md = GenericMetadata(
             data_origin=MetadataOrigin(self.id, self.name),
-            issue_id=utils.xlate(issue["id"]),
-            series_id=utils.xlate(series["id"]),
+            # IDs are always integers, only the free text fields need stripping and blank checks
+            issue_id=str(issue["id"]),
+            series_id=str(series["id"]),
             publisher=utils.xlate(series.get("publisher_name")),
             series=utils.xlate(series["name"]),
         )
@@ -1011,7 +1552,8 @@ class GCDTalker(ComicTalker):
             md.issue = issue_number
 
         md._cover_image = issue.get("image")
-        md._alternate_images = issue.get("alt_image_urls")
+        # The issue may be shared through the memo and decode caches, never hand out its lists
+        md._alternate_images = list(issue.get("alt_image_urls", []))
 
         if issue.get("characters"):
             # Logan [disambiguation: Wolverine] - (name) James Howlett
@@ -1047,15 +1589,20 @@ class GCDTalker(ComicTalker):
         if self.combine_notes:
             md.description = series.get("notes", "")
             md.description += issue.get("issue_notes", "")
-        if len(issue["synopses"]) == len(issue["story_titles"]):
-            # Will presume titles go with synopsis if there are the same number
-            for i, title in enumerate(issue["story_titles"]):
-                if title and issue["synopses"][i]:
-                    md.description += f"{title}: {issue['synopses'][i]}\r\n\r\n"
+        if "story_descriptions" in issue:
+            md.description += "\r\n\r\n".join(issue["story_descriptions"])
+        elif len(issue["synopses"]) == len(issue["story_titles"]):
+            # Older cache entries only have the separate lists, will presume titles go with synopsis if there are the
+            # same number
+            md.description += "".join(
+                f"{title}: {synopsis}\r\n\r\n"
+                for title, synopsis in zip(issue["story_titles"], issue["synopses"])
+                if title and synopsis
+            )
         else:
             md.description += "\r\n\r\n".join(issue["synopses"])
 
-        url = urljoin(self.website, f"issue/{issue['id']}")
+        url = f"{self._issue_url_prefix}{issue['id']}"
         if url:
             try:
                 md.web_links = [parse_url(url)]